@@ -1,100 +1,137 @@
 import streamlit as st
 import datetime
+import base64
+import io
 import json
-import random
 import os
-from PIL import Image
+import re
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 # --- Helper Functions (Added/Modified for better structure) ---
 
-def get_accurate_hijri_date():
+URDU_HIJRI_MONTHS = [
+    "محرم", "صفر", "ربیع الاول", "ربیع الثانی", "جمادی الاول", "جمادی الثانی",
+    "رجب", "شعبان", "رمضان", "شوال", "ذوالقعدہ", "ذوالحجہ"
+]
+
+def _to_hijri(today_iso):
+    """Convert an ISO Gregorian date to Hijri (Umm al-Qura), or None if unavailable"""
+    try:
+        from hijri_converter import Gregorian
+        today = datetime.date.fromisoformat(today_iso)
+        return Gregorian(today.year, today.month, today.day).to_hijri()
+    except (ImportError, OverflowError):
+        return None
+
+@st.cache_data(ttl=24 * 3600)
+def get_accurate_hijri_date(today_iso):
     """
-    NOTE: For live accurate Hijri date, you must use a library 
-    like 'hijri-converter' or an external API. 
-    For now, this function returns a fixed date (Oct 18, 2025 = 18 Jumada al-Thani 1446 AH)
-    You should run: pip install hijri-converter and update the function.
+    Get the Hijri date for the given ISO date using 'hijri-converter'.
+    Cached per day; falls back to a fixed date if the library is missing.
     """
-    # Placeholder for live functionality:
-    # from hijri_converter import Gregorian
-    # today = datetime.date.today()
-    # hijri_date = Gregorian(today.year, today.month, today.day).to_hijri()
-    # return f"{hijri_date.day} {hijri_date.get_month_name(lang='ur')}, {hijri_date.year} ہجری"
-    
-    return "18 جمادی الثانی, 1446 ہجری"
+    hijri_date = _to_hijri(today_iso)
+    if hijri_date is None:
+        return "18 جمادی الثانی, 1446 ہجری"
+    return f"{hijri_date.day} {URDU_HIJRI_MONTHS[hijri_date.month - 1]}, {hijri_date.year} ہجری"
+
+@st.cache_data(ttl=24 * 3600)
+def get_current_islamic_month(today_iso):
+    """Get current Islamic month for the given ISO date"""
+    hijri_date = _to_hijri(today_iso)
+    if hijri_date is None:
+        return "جمادی الثانی"
+    return URDU_HIJRI_MONTHS[hijri_date.month - 1]
 
-def get_current_islamic_month():
-    """Get current Islamic month - Placeholder"""
-    return "جمادی الثانی"
+# Fixed prayer times per city, built once at import (read-only views)
+_PRAYER_TIMES = MappingProxyType({
+    "Karachi": MappingProxyType({
+        "فجر": "05:15 AM",
+        "طلوع آفتاب": "06:45 AM", 
+        "ظہر": "12:30 PM",
+        "عصر": "04:00 PM",
+        "مغرب": "06:45 PM",
+        "عشاء": "08:15 PM"
+    }),
+    "Lahore": MappingProxyType({
+        "فجر": "04:45 AM",
+        "طلوع آفتاب": "06:15 AM",
+        "ظہر": "12:15 PM",
+        "عصر": "03:45 PM",
+        "مغرب": "06:30 PM",
+        "عشاء": "08:00 PM"
+    }),
+    "Islamabad": MappingProxyType({
+        "فجر": "04:30 AM",
+        "طلوع آفتاب": "06:00 AM",
+        "ظہر": "12:10 PM",
+        "عصر": "03:40 PM",
+        "مغرب": "06:25 PM",
+        "عشاء": "07:55 PM"
+    }),
+    "Peshawar": MappingProxyType({
+        "فجر": "04:35 AM",
+        "طلوع آفتاب": "06:05 AM",
+        "ظہر": "12:20 PM",
+        "عصر": "03:50 PM",
+        "مغرب": "06:35 PM",
+        "عشاء": "08:05 PM"
+    }),
+    "Quetta": MappingProxyType({
+        "فجر": "05:00 AM",
+        "طلوع آفتاب": "06:30 AM",
+        "ظہر": "12:40 PM",
+        "عصر": "04:10 PM",
+        "مغرب": "07:00 PM",
+        "عشاء": "08:30 PM"
+    })
+})
 
 def get_prayer_times(city="Karachi"):
     """Get prayer times for different cities - Fixed data for example"""
-    prayer_times_data = {
-        "Karachi": {
-            "فجر": "05:15 AM",
-            "طلوع آفتاب": "06:45 AM", 
-            "ظہر": "12:30 PM",
-            "عصر": "04:00 PM",
-            "مغرب": "06:45 PM",
-            "عشاء": "08:15 PM"
-        },
-        "Lahore": {
-            "فجر": "04:45 AM",
-            "طلوع آفتاب": "06:15 AM",
-            "ظہر": "12:15 PM",
-            "عصر": "03:45 PM",
-            "مغرب": "06:30 PM",
-            "عشاء": "08:00 PM"
-        },
-        "Islamabad": {
-            "فجر": "04:30 AM",
-            "طلوع آفتاب": "06:00 AM",
-            "ظہر": "12:10 PM",
-            "عصر": "03:40 PM",
-            "مغرب": "06:25 PM",
-            "عشاء": "07:55 PM"
-        },
-        "Peshawar": {
-            "فجر": "04:35 AM",
-            "طلوع آفتاب": "06:05 AM",
-            "ظہر": "12:20 PM",
-            "عصر": "03:50 PM",
-            "مغرب": "06:35 PM",
-            "عشاء": "08:05 PM"
-        },
-        "Quetta": {
-            "فجر": "05:00 AM",
-            "طلوع آفتاب": "06:30 AM",
-            "ظہر": "12:40 PM",
-            "عصر": "04:10 PM",
-            "مغرب": "07:00 PM",
-            "عشاء": "08:30 PM"
-        }
-    }
-    
-    return prayer_times_data.get(city, prayer_times_data["Karachi"])
+    return _PRAYER_TIMES.get(city, _PRAYER_TIMES["Karachi"])
 
-def get_zawal_time(dhuhr_time):
+# Same inputs as strptime's "%I:%M %p": hour 1-12, minute 0-59, any case for AM/PM
+_TIME_RE = re.compile(r"(1[0-2]|0?[1-9]):([0-5]?\d)\s+(AM|PM)", re.IGNORECASE)
+
+def get_zawal_time(dhuhr_time, minutes_before=5):
     """Calculate Zawal time (midday when sun is at zenith)"""
+    # Zawal time is typically a few minutes before Dhuhr. Let's use 5 minutes.
+    match = _TIME_RE.fullmatch(dhuhr_time)
+    if not match:
+        return "11:45 AM" # Fallback time
+    hour, minute, period = int(match[1]), int(match[2]), match[3].upper()
+    total = ((hour % 12) + (12 if period == "PM" else 0)) * 60 + minute - minutes_before
+    hour24, minute = divmod(total % (24 * 60), 60)
+    return f"{hour24 % 12 or 12:02d}:{minute:02d} {'PM' if hour24 >= 12 else 'AM'}"
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))  # Resolve data/images next to this script, not the cwd
+IMAGE_FOLDER = os.path.join(APP_DIR, "islamic")  # Folder where images are stored
+GALLERY_IMAGE_SIZE = (800, 800)  # Max size of gallery images
+GALLERY_JPEG_QUALITY = 82  # Re-encode quality; visually lossless at gallery size
+
+def _open_gallery_image(image_path):
+    """Downscale one gallery image to JPEG bytes; returns (bytes, error) so workers never touch st.*"""
+    from PIL import Image  # only needed when the images folder exists
+    
     try:
-        # Convert Urdu time names to English for parsing if necessary, but using the existing structure:
-        # We need the Dhuhr time key, which is "ظہر" in the dictionary, but the function input expects the time string.
-        dhuhr_dt = datetime.datetime.strptime(dhuhr_time, "%I:%M %p")
-        # Zawal time is typically a few minutes before Dhuhr. Let's use 5 minutes.
-        zawal_dt = dhuhr_dt - datetime.timedelta(minutes=5)
-        return zawal_dt.strftime("%I:%M %p")
+        with Image.open(image_path) as img:
+            # Let libjpeg decode at a reduced scale, then downscale for the gallery
+            img.draft("RGB", GALLERY_IMAGE_SIZE)
+            img.thumbnail(GALLERY_IMAGE_SIZE, Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            img.convert("RGB").save(buffer, "JPEG", quality=GALLERY_JPEG_QUALITY, optimize=True)
+        return buffer.getvalue(), None
     except Exception as e:
-        # st.error(f"Error calculating Zawal: {e}") # for debugging
-        return "11:45 AM" # Fallback time
+        return None, e
 
+@st.cache_resource(show_spinner=False)
 def load_islamic_images():
-    """Load Islamic images from local folder"""
+    """Load Islamic images from local folder as encoded bytes (cached across reruns and sessions)"""
     images = {}
-    image_folder = "islamic"  # Folder name where images are stored
-    
-    # Check if folder exists
-    if not os.path.exists(image_folder):
-        st.warning(f"📁 '{image_folder}' فولڈر نہیں ملا۔ براہ کرم چیک کریں کہ فولڈر موجود ہے۔")
-        return images
+    image_folder = IMAGE_FOLDER
     
     # Define image mappings
     image_files = {
@@ -104,336 +141,523 @@ def load_islamic_images():
         "fateh_makkah": "104.jpg"
     }
     
-    # Load images
-    for image_name, filename in image_files.items():
-        image_path = os.path.join(image_folder, filename)
-        if os.path.exists(image_path):
-            try:
-                images[image_name] = Image.open(image_path)
-            except Exception as e:
-                st.warning(f"تصویر لوڈ نہیں ہو سکی {filename}: {e}")
-        else:
-            st.warning(f"📄 فائل نہیں ملی: {image_path}")
+    # List the folder once instead of stat-ing every file
+    try:
+        present = {entry.name for entry in os.scandir(image_folder) if entry.is_file()}
+    except FileNotFoundError:
+        return images
+    
+    # Decode the images in parallel; PIL releases the GIL inside libjpeg
+    to_load = [(name, filename) for name, filename in image_files.items() if filename in present]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(_open_gallery_image, (os.path.join(image_folder, fn) for _, fn in to_load))
+        for (image_name, filename), (img, error) in zip(to_load, results):
+            if error is None:
+                images[image_name] = img
+            else:
+                st.warning(f"تصویر لوڈ نہیں ہو سکی {filename}: {error}")
+    
+    for filename in image_files.values():
+        if filename not in present:
+            st.warning(f"📄 فائل نہیں ملی: {os.path.join(image_folder, filename)}")
     
     return images
 
-# --- Islamic Data (No changes needed, data is comprehensive) ---
-HADITHS = [
-    {"arabic": "إنما الأعمال بالنيات", "urdu": "اعمال کا دارومدار نیتوں پر ہے", "reference": "بخاری"},
-    {"arabic": "من حسن إسلام المرء تركه ما لا يعنيه", "urdu": "آدمی کے اسلام کے اچھا ہونے کی علامت یہ ہے کہ وہ بیکار باتوں کو چھوڑ دے", "reference": "ترمذی"},
-    {"arabic": "لا يؤمن أحدكم حتى يحب لأخيه ما يحب لنفسه", "urdu": "تم میں سے کوئی شخص اس وقت تک مومن نہیں ہوسکتا جب تک اپنے بھائی کے لیے وہی پسند نہ کرے جو اپنے لیے پسند کرتا ہے", "reference": "بخاری"},
-    {"arabic": "الكلمة الطيبة صدقة", "urdu": "اچھی بات بھی صدقہ ہے", "reference": "بخاری"},
-    {"arabic": "اتق الله حيثما كنت", "urdu": "جہاں کہیں بھی ہو اللہ سے ڈرو", "reference": "ترمذی"},
-    {"arabic": "الطهور شطر الإيمان", "urdu": "پاکیزگی آدھا ایمان ہے", "reference": "مسلم"},
-]
+# (image key, title, caption, subtitle, placeholder text), in 2x2 grid order
+_GALLERY_CARDS = (
+    ("masjid_haram", "مسجد الحرام، مکہ", "مسجد الحرام، مکہ مکرمہ", "مکہ مکرمہ، سعودی عرب",
+     "📷 مسجد الحرام کی تصویر 'islamic/101.jpg' فائل میں شامل کریں"),
+    ("masjid_aqsa", "مسجد اقصیٰ، فلسطین", "مسجد اقصیٰ، بیت المقدس", "بیت المقدس، فلسطین",
+     "📷 مسجد اقصیٰ کی تصویر 'islamic/103.jpg' فائل میں شامل کریں"),
+    ("masjid_nabwi", "مسجد نبوی، مدینہ", "مسجد نبوی، مدینہ منورہ", "مدینہ منورہ، سعودی عرب",
+     "📷 مسجد نبوی کی تصویر 'islamic/102.jpg' فائل میں شامل کریں"),
+    ("fateh_makkah", "فتح مکہ", "فتح مکہ کا منظر", "8ھ میں رسول اللہ ﷺ کا مکہ فتح کرنا",
+     "📷 فتح مکہ کی تصویر 'islamic/104.jpg' فائل میں شامل کریں"),
+)
 
-QURAN_VERSES = [
-    {"arabic": "إِنَّ مَعَ الْعُسْرِ يُسْرًا", "urdu": "بے شک مشکل کے ساتھ آسانی ہے", "surah": "الشرح", "verse": "6"},
-    {"arabic": "وَإِنَّ اللَّهَ مَعَ الصَّابِرِينَ", "urdu": "اور بے شک اللہ صبر کرنے والوں کے ساتھ ہے", "surah": "البقرة", "verse": "153"},
-    {"arabic": "رَبِّ زِدْنِي عِلْمًا", "urdu": "اے میرے رب، میرے علم میں اضافہ فرما", "surah": "طہ", "verse": "114"},
-    {"arabic": "إِنَّ اللَّهَ يُحِبُّ التَّوَّابِينَ وَيُحِبُّ الْمُتَطَهِّرِينَ", "urdu": "بے شک اللہ توبہ کرنے والوں اور پاک رہنے والوں کو پسند فرماتا ہے", "surah": "البقرة", "verse": "222"},
-    {"arabic": "قُلْ هُوَ اللَّهُ أَحَدٌ", "urdu": "کہو وہ اللہ ایک ہے", "surah": "الاخلاص", "verse": "1"},
-    {"arabic": "لَا إِلَٰهَ إِلَّا اللَّهُ", "urdu": "اللہ کے سوا کوئی معبود نہیں", "surah": "الصافات", "verse": "35"},
-]
+_GALLERY_IMAGE_TMPL = '<img src="data:image/jpeg;base64,{b64}" alt="{caption}"><figcaption>{caption}</figcaption>'
+_GALLERY_MISSING_TMPL = '<p class="gallery-missing">{placeholder}</p>'
 
-KIDS_SECTION = {
-    "stories": [
-        {"title": "حضرت ابراہیم علیہ السلام کی کہانی", "content": "حضرت ابراہیم علیہ السلام نے اللہ کو پانے کے لیے بہت کوشش کی۔ وہ سورج، چاند اور ستاروں کو پوجتے ہوئے لوگوں کو سمجھاتے تھے کہ یہ سب اللہ کی بنائی ہوئی مخلوق ہیں۔ انہوں نے بتوں کو توڑا اور لوگوں کو توحید کی دعوت دی۔"},
-        {"title": "حضرت یوسف علیہ السلام کی کہانی", "content": "حضرت یوسف علیہ السلام کو ان کے بھائیوں نے کنویں میں ڈال دیا تھا۔ پھر وہ مصر پہنچے اور بادشاہ کے خوابوں کی تعبیر بتا کر مصر کے خزانے کے وزیر بن گئے۔ آخرکار ان کے بھائی ان کے پاس آئے اور سب مل گئے۔"},
-        {"title": "ہاتھی والوں کی کہانی", "content": "ایک بادشاہ جس کا نام ابرہہ تھا، اس نے کعبہ کو گرانے کے لیے ہاتھیوں کی فوج بھیجی۔ اللہ نے چھوٹے چھوٹے پرندے بھیجے جنہوں نے پتھر برسائے اور ابرہہ کی فوج تباہ ہو گئی۔"},
-    ],
-    "duas": [
-        {"arabic": "رَبِّ زِدْنِي عِلْمًا", "urdu": "اے میرے رب، میرے علم میں اضافہ فرما", "source": "سورۃ طہ - آیت 114"},
-        {"arabic": "رَبِّ اشْرَحْ لِي صَدْرِي", "urdu": "اے میرے رب، میرے سینے کو کشادہ فرما", "source": "سورۃ طہ - آیت 25"},
-        {"arabic": "رَبِّ أَعُوذُ بِكَ مِنْ هَمَزَاتِ الشَّيَاطِينِ", "urdu": "اے میرے رب، میں شیطانوں کے وسوسوں سے تیری پناہ مانگتا ہوں", "source": "سورۃ المؤمنون - آیت 97"},
-        {"arabic": "اَللّٰهُمَّ اِنِّیْ اَعُوْذُ بِکَ مِنْ عَذَابِ الْقَبْرِ", "urdu": "اے اللہ میں قبر کے عذاب سے تیری پناہ مانگتا ہوں", "source": "صحیح مسلم"},
-    ]
-}
+@st.cache_resource(show_spinner=False)
+def render_gallery_html(loaded, _images):
+    """Build the whole image gallery as one HTML grid; keyed on which images loaded, since the bytes never change"""
+    # Deliberate trade-off: the ~280 KB of base64 HTML is resent on each full rerun instead of
+    # st.image media URLs the browser could cache, in exchange for one element instead of 16
+    return '<div class="gallery-grid">' + "".join([
+        f'<figure class="gallery-card"><h3>{title}</h3>'
+        + (_GALLERY_IMAGE_TMPL.format(b64=base64.b64encode(_images[key]).decode("ascii"), caption=caption)
+           if key in loaded else _GALLERY_MISSING_TMPL.format(placeholder=placeholder))
+        + f'<p><b>{subtitle}</b></p></figure>'
+        for key, title, caption, subtitle, placeholder in _GALLERY_CARDS
+    ]) + '</div>'
 
-TAUHEED_SECTION = {
-    "definition": {
-        "title": "توحید - اسلام کی بنیاد",
-        "description": "توحید کا مطلب ہے اللہ تعالیٰ کو ایک ماننا، اس کے ساتھ کسی کو شریک نہ کرنا۔ یہ اسلام کی سب سے اہم بنیاد ہے۔",
-        "importance": "توحید پورے دین کی بنیاد ہے۔ نبی کریم ﷺ نے سب سے پہلے لوگوں کو توحید کی دعوت دی۔"
-    },
-    "types": {
-        "rububiyyah": {
-            "title": "توحید الربوبیت",
-            "description": "اللہ کو رب کے طور پر ایک ماننا",
-            "points": [
-                "اللہ ہی خالق ہے",
-                "اللہ ہی رازق ہے", 
-                "اللہ ہی زندگی اور موت دینے والا ہے",
-                "اللہ ہی تمام کائنات کا مالک ہے",
-                "اللہ ہی ہر چیز کا انتظام کرنے والا ہے"
-            ]
-        },
-        "uluhiyyah": {
-            "title": "توحید الالوہیت",
-            "description": "اللہ کی عبادت میں کسی کو شریک نہ کرنا",
-            "points": [
-                "صرف اللہ کی عبادت کرنا",
-                "صرف اللہ سے دعا مانگنا",
-                "صرف اللہ سے مدد طلب کرنا",
-                "صرف اللہ کے آئے ہوئے قانون پر چلنا",
-                "صرف اللہ کے لیے نذر و نیاز کرنا"
-            ]
-        },
-        "asma_was_sifat": {
-            "title": "توحید الاسماء والصفات",
-            "description": "اللہ کے ناموں اور صفات میں اسے یکتا ماننا",
-            "points": [
-                "اللہ کے ناموں میں اسے یکتا ماننا",
-                "اللہ کی صفات میں اسے یکتا ماننا",
-                "اللہ کی صفات میں مشابہت نہ کرنا",
-                "اللہ کے ناموں اور صفات کی توقیر کرنا",
-                "اللہ کی صفات کو بغیر کیفیات کے ماننا"
-            ]
-        }
-    },
-    "benefits": [
-        "اللہ کی محبت حاصل ہوتی ہے",
-        "دل میں اطمینان پیدا ہوتی ہے",
-        "گناہوں سے معافی ملتی ہے",
-        "جنت میں داخلہ ملتا ہے",
-        "خوف و غم سے نجات ملتی ہے",
-        "عملوں میں برکت ہوتی ہے"
-    ],
-    "kids_learning": [
-        "کلمہ طیبہ: لا الہ الا اللہ محمد رسول اللہ",
-        "اللہ کی وحدانیت کی کہانیاں پڑھیں",
-        "توحید کے بارے میں سوالات پوچھیں",
-        "توحید سے متعلق کارٹونز دیکھیں",
-        "توحید کی مشق کریں (صرف اللہ سے دعا مانگنا)"
-    ],
-    "quran_verses": [
-        {"arabic": "قُلْ هُوَ اللَّهُ أَحَدٌ", "urdu": "کہو وہ اللہ ایک ہے", "surah": "الاخلاص", "verse": "1"},
-        {"arabic": "وَإِلَٰهُكُمْ إِلَٰهٌ وَاحِدٌ", "urdu": "اور تمہارا معبود ایک ہی معبود ہے", "surah": "البقرة", "verse": "163"},
-        {"arabic": "لَا إِلَٰهَ إِلَّا أَنَا فَاعْبُدُونِ", "urdu": "میرے سوا کوئی معبود نہیں، پس تم میری عبادت کرو", "surah": "الانبیاء", "verse": "25"}
-    ]
-}
+@st.cache_data
+def _css():
+    """Static page stylesheet, built once per process (no external font requests)"""
+    return """
+<style>
+    /* Fonts come from the visitor's system; each stack ends in a generic fallback */
+    .main-header {
+        font-size: 2.5rem;
+        color: #2E86AB;
+        text-align: center;
+        margin-bottom: 2rem;
+        font-weight: bold;
+        font-family: 'Jameel Noori Nastaleeq', 'Arial', sans-serif;
+    }
+    .section-header {
+        font-size: 1.8rem;
+        color: #A23B72;
+        margin: 1rem 0;
+        font-weight: bold;
+        font-family: 'Jameel Noori Nastaleeq', 'Arial', sans-serif;
+    }
+    .arabic-text {
+        font-size: 1.6rem;
+        text-align: right;
+        direction: rtl;
+        font-family: 'Noto Naskh Arabic', 'Traditional Arabic', serif;
+        line-height: 2;
+    }
+    .urdu-text {
+        font-size: 1.3rem;
+        text-align: right;
+        direction: rtl;
+        font-family: 'Jameel Noori Nastaleeq', 'Arial', serif;
+        line-height: 2;
+    }
+    .highlight-box {
+        background-color: #F8F9FA;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-right: 5px solid #2E86AB;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    /* Native <details> rows used for the hadith list instead of st.expander */
+    .hadith-details {
+        border: 1px solid #e6e6e6;
+        border-radius: 10px;
+        margin: 0.5rem 0;
+        padding: 0.5rem 1rem;
+    }
+    .hadith-details summary {
+        cursor: pointer;
+        direction: rtl;
+        text-align: right;
+    }
+    .flex-row {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 0.5rem;
+    }
+    .flex-row > div {
+        flex: 1;
+    }
+    .prayer-time {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 0.5rem;
+    }
+    .date-box {
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 0.5rem;
+    }
+    .taharat-box {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin: 0.5rem;
+    }
+    .taharat-wudu { background: #2E86AB; }
+    .taharat-ghusal { background: #A23B72; }
+    .taharat-box p {
+        font-size: 1rem;
+        color: white;
+    }
+    .tauheed-box {
+        background: linear-gradient(135deg, #ff6b6b 0%, #ffa8a8 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin: 0.5rem;
+        text-align: center;
+    }
+    .tauheed-box p {
+        font-size: 1.1rem;
+        color: white;
+    }
+    .kids-section {
+        background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+    }
+    .jihad-box {
+        background: linear-gradient(135deg, #ff7eb3 0%, #ff758c 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin: 0.5rem;
+    }
+    .jihad-box p {
+        font-size: 1.1rem;
+        color: white;
+    }
+    /* Image gallery cards, and the st.container(key="video_...") wrappers in the media gallery */
+    .gallery-card, div[class*="st-key-video_"] {
+        text-align: center;
+        margin: 1rem 0;
+        padding: 1rem;
+        background: #f8f9fa;
+        border-radius: 10px;
+    }
+    .gallery-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 1rem;
+    }
+    @media (max-width: 640px) {
+        .gallery-grid { grid-template-columns: 1fr; }
+    }
+    .gallery-card img {
+        width: 100%;
+        border-radius: 10px;
+    }
+    .gallery-card figcaption {
+        color: #666;
+        font-size: 0.9rem;
+    }
+    .gallery-missing {
+        background: #e8f4fd;
+        color: #0c5460;
+        padding: 1rem;
+        border-radius: 10px;
+    }
+    .developer-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        margin: 1rem 0;
+    }
+</style>
+"""
+
+# --- Islamic Data (kept in data/islamic.json) ---
+DATA_FILE = os.path.join(APP_DIR, "data", "islamic.json")
+
+Content = namedtuple(
+    "Content",
+    ["hadiths", "quran_verses", "kids_section", "tauheed_section", "islamic_pillars", "taharat_section"]
+)
+
+@st.cache_resource(show_spinner=False)
+def load_data():
+    """Load the Islamic content once per process; the same (read-only) object is shared by all sessions"""
+    with open(DATA_FILE, encoding="utf-8") as f:
+        return Content(**json.load(f))
+
+def _normalize(text):
+    """Casefold and strip combining marks (harakat), so searches match with or without diacritics"""
+    return "".join([c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c)]).casefold()
 
-ISLAMIC_PILLARS = {
-    "salah": {
-        "title": "نماز - دین کا ستون",
-        "description": "نماز اللہ سے بات چیت کا ذریعہ ہے۔ یہ دن میں 5 وقت فرض ہے۔",
-        "times": [
-            "فجر: صبح صادق سے سورج نکلنے سے پہلے",
-            "ظہر: دوپہر ڈھلنے کے بعد",
-            "عصر: سایہ ہر چیز سے دوگنا ہونے تک",
-            "مغرب: سورج ڈوبنے کے بعد",
-            "عشاء: شفق غائب ہونے سے صبح صادق تک"
-        ],
-        "benefits": [
-            "اللہ کا قرب حاصل ہوتا ہے",
-            "دل پاکیزہ ہوتا ہے",
-            "برائیوں سے بچاؤ ہوتا ہے",
-            "دن کی ترتیب بنتی ہے",
-            "صبر کی عادت پڑتی ہے"
-        ],
-        "kids_practice": [
-            "چھوٹی چھوٹی نمازیں پڑھنا سیکھیں",
-            "وضو کا طریقہ سیکھیں",
-            "نماز کی سورتیں یاد کریں",
-            "نماز کے قواعد سیکھیں",
-            "خاندان کے ساتھ نماز پڑھیں"
-        ],
-        "importance": "نماز اسلام کا دوسرا رکن ہے۔ ہر مسلمان پر دن میں 5 وقت فرض ہے۔ قیامت میں سب سے پہلے نماز کا حساب ہوگا۔"
-    },
-    "fasting": {
-        "title": "روزہ - صبر کی تربیت",
-        "description": "صبح صادق سے لے کر سورج ڈوبنے تک کھانے پینے اور بری باتوں سے رکنا۔",
-        "types": [
-            "رمضان کے روزے: فرض",
-            "نفلی روزے: سنت",
-            "قضا روزے: چھوٹے ہوئے روزے",
-            "کفارے کے روزے: گناہوں کے لیے"
-        ],
-        "conditions": [
-            "بچوں پر بلوغت کے بعد فرض ہیں",
-            "بیمار اور مسافر کے لیے رعایت ہے",
-            "حائضہ عورت کے لیے رعایت ہے"
-        ],
-        "benefits": [
-            "صبر کی عادت پڑتی ہے",
-            "غریبوں کی مشکلات کا احساس ہوتا ہے",
-            "نفس پر قابو پاتے ہیں",
-            "صحت کے لیے فائدہ مند ہے",
-            "گناہوں کی معافی ہوتی ہے"
-        ],
-        "kids_tips": [
-            "چھوٹے روزے رکھیں (نصف دن)",
-            "رمضان میں کچھ روزے رکھیں",
-            "سحری و افطار میں شامل ہوں",
-            "روزہ کی برکات کے بارے میں سیکھیں"
-        ]
-    },
-    "zakat": {
-        "title": "زکواۃ - مال کی پاکیزگی",
-        "description": "ہر سال اپنے مال کا 2.5% غریبوں کو دینا۔",
-        "conditions": [
-            "عاقل و بالغ مسلمان پر",
-            "صاحب نصاب ہو (ساڑھے سات تولہ سونا یا ساڑھے باون تولہ چاندی کا مالک ہو)",
-            "مال پر پورا سال گزر چکا ہو"
-        ],
-        "recipients": [
-            "غریب اور مسکین",
-            "زکواۃ وصول کرنے والے",
-            "اسلام قبول کرنے والے",
-            "قرض دار",
-            "مسافر"
-        ],
-        "benefits": [
-            "مال پاک ہوتا ہے",
-            "غریبوں کی مدد ہوتی ہے",
-            "معاشرے سے غربت ختم ہوتی ہے",
-            "اللہ کی رضا ملتی ہے",
-            "مال میں برکت ہوتی ہے"
-        ],
-        "kids_practice": [
-            "اپنی جیب خرچی سے کچھ پیسے غریبوں کو دیں",
-            "صدقہ دینے کی عادت ڈالیں",
-            "زکواۃ کی اہمیت سیکھیں",
-            "غریبوں کی مدد کرنا سیکھیں"
-        ]
-    },
-    "hajj": {
-        "title": "حج - زندگی کی سب سے بڑی عبادت",
-        "description": "زندگی میں ایک بار مکہ مکرمہ جا کر اللہ کے گھر کی زیارت کرنا۔",
-        "conditions": [
-            "عاقل و بالغ مسلمان پر",
-            "صحت مند ہو",
-            "راستہ محفوظ ہو",
-            "گھر کے اخراجات کے علاوہ ضروری رقم ہو"
-        ],
-        "steps": [
-            "احرام: خاص لباس پہننا",
-            "طواف: کعبہ کے گرد سات چکر لگانا",
-            "سعی: صفا اور مروہ کے درمیان سات چکر لگانا",
-            "عرفات: 9 ذوالحجہ کو عرفات میں ٹھہرنا",
-            "رمی جمرات: شیطان کو پتھر مارنا"
-        ],
-        "benefits": [
-            "گناہ معاف ہوتے ہیں",
-            "مسلمانوں کی بھائی چارگی بڑھتی ہے",
-            "اللہ کا قرب حاصل ہوتا ہے",
-            "دنیا بھر کے مسلمانوں سے ملاقات ہوتی ہے",
-            "ایمان تازہ ہوتا ہے"
-        ],
-        "kids_learning": [
-            "حج کی کہانیاں پڑھیں",
-            "حج کے طریقے سیکھیں",
-            "کعبہ کی تصاویر دیکھیں",
-            "حج کی ویڈیوز دیکھیں"
-        ]
-    },
-    "jihad": {
-        "title": "جہاد - دین کی سربلندی کی جدوجہد",
-        "description": "جہاد کا مطلب ہے اللہ کی راہ میں کوشش کرنا۔ یہ مختلف شکلوں میں ہوتا ہے۔",
-        "types": [
-            "جہاد بالنفس: نفس کے خلاف جدوجہد",
-            "جہاد بالمال: مال خرچ کرنا",
-            "جہاد باللسان: زبان سے حق کی تبلیغ",
-            "جہاد بالید: ہاتھ سے برائی روکنا",
-            "جہاد بالسيف: دفاعی جنگ"
-        ],
-        "conditions": [
-            "مسلمان حکمران کی اجازت سے",
-            "صرف دفاعی مقاصد کے لیے",
-            "عوام کو نقصان نہ پہنچانا",
-            "معاہدوں کی پاسداری کرنا"
-        ],
-        "benefits": [
-            "اللہ کی رضا حاصل ہوتی ہے",
-            "دین کی سربلندی ہوتی ہے",
-            "مظلوموں کی مدد ہوتی ہے",
-            "ایمان مضبوط ہوتا ہے",
-            "شہادت کا درجہ ملتا ہے"
-        ],
-        "misconceptions": [
-            "جہاد صرف جنگ نہیں ہے",
-            "جہاد دہشت گردی نہیں ہے",
-            "جہاد میں عورتوں، بچوں اور بوڑھوں کو نقصان نہیں پہنچایا جا سکتا",
-            "جہاد صرف مسلمانوں کے خلاف نہیں ہے"
-        ],
-        "kids_learning": [
-            "جہاد کے صحیح معنی سیکھیں",
-            "اپنے نفس کے خلاف جہاد کریں",
-            "برائیوں کے خلاف آواز اٹھائیں",
-            "دین کی تبلیغ کریں"
-        ]
+def _search_text(record):
+    """Normalized arabic and urdu joined by a newline, which a single-line query can never span"""
+    return _normalize(record["arabic"]) + "\n" + _normalize(record["urdu"])
+
+@st.cache_resource(show_spinner=False)
+def search_index():
+    """(search text, record) pairs for hadiths and verses, built once"""
+    content = load_data()
+    return (
+        [(_search_text(h), h) for h in content.hadiths],
+        [(_search_text(v), v) for v in content.quran_verses],
+    )
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def do_search(search_term):
+    """Hadiths and verses matching a query; the corpus is static, so repeated queries are cache hits"""
+    hadith_index, verse_index = search_index()
+    term = _normalize(search_term)
+    if not term.strip():
+        # A query of only harakat/whitespace normalizes to "", which would match everything
+        return [], []
+    found_hadiths = [h for text, h in hadith_index if term in text]
+    found_verses = [v for text, v in verse_index if term in text]
+    return found_hadiths, found_verses
+
+# HTML cards for verses, hadiths and duas, filled with str.format
+_VERSE_TMPL = (
+    '<div class="highlight-box">'
+    '<div class="arabic-text">{arabic}</div>'
+    '<div class="urdu-text">{urdu}</div>'
+    '<p style="text-align: left; color: #666;">📖 سورۃ <b>{surah}</b> - آیت <b>{verse}</b></p>'
+    '</div>'
+)
+
+_HADITH_TMPL = (
+    '<div class="highlight-box" style="border-right: 5px solid #A23B72;">'
+    '<div class="arabic-text">{arabic}</div>'
+    '<div class="urdu-text">{urdu}</div>'
+    '<p style="text-align: left;">📚 حوالہ: {reference}</p>'
+    '</div>'
+)
+
+_DUA_TMPL = (
+    '<div class="highlight-box" style="border-right: 5px solid #A23B72;">'
+    '<h5 style="text-align: right; direction: rtl;">{i}. {urdu}</h5>'
+    '<div class="arabic-text">{arabic}</div>'
+    '<p style="text-align: left; color: #666;">📚 ماخذ: {source}</p>'
+    '</div>'
+)
+
+def _lines(items, template="• {}"):
+    """Join list items into one markdown block, one line per item (one element instead of N)"""
+    return "  \n".join([template.format(item) for item in items])
+
+def _numbered_lines(items):
+    """Like _lines, but numbers each item as **1.**, **2.**, ..."""
+    return "  \n".join([f"**{i}.** {item}" for i, item in enumerate(items, 1)])
+
+@st.cache_data
+def render_tauheed_html():
+    """Build the Tauheed tabs' lists and HTML blocks once; nothing here depends on widgets"""
+    tauheed_section = load_data().tauheed_section
+    return {
+        "kids_learning": _lines(tauheed_section["kids_learning"]),
+        "benefits": _lines(tauheed_section["benefits"]),
+        "points": {
+            key: "".join([
+                f'<div class="tauheed-box"><p class="urdu-text">{point}</p></div>'
+                for point in tauheed_type["points"]
+            ])
+            for key, tauheed_type in tauheed_section["types"].items()
+        },
+        "benefits_spiritual": _lines(tauheed_section["benefits_spiritual"], "🌟 {}"),
+        "benefits_worldly": _lines(tauheed_section["benefits_worldly"], "💫 {}"),
+        "verses": "".join([_VERSE_TMPL.format(**verse) for verse in tauheed_section["quran_verses"]]),
     }
-}
 
-TAHARAT_SECTION = {
-    "wudu": {
-        "farz": [
-            "چہرہ دھونا (منہ کے بالوں سے لے کر ٹھوڑی تک اور ایک کان سے دوسرے کان تک)",
-            "دونوں ہاتھ کہنیوں سمیت دھونا",
-            "سر کا مسح کرنا (چوتھائی سر پر مسح کرنا فرض ہے)",
-            "دونوں پاؤں ٹخنوں سمیت دھونا"
-        ],
-        "sunnat": [
-            "وضو شروع میں بسم اللہ پڑھنا",
-            "تین بار کلی کرنا",
-            "تین بار ناک میں پانی ڈالنا", 
-            "داڑھی کا خلال کرنا",
-            "ہاتھ پاؤں تین بار دھونا",
-            "مسلسل وضو کرنا (ایک عضو خشک ہونے سے پہلے دوسرا دھونا)"
-        ],
-        "mustahab": [
-            "وضو قبلہ رخ ہو کر کرنا",
-            "کسی جگہ بیٹھ کر وضو کرنا",
-            "دانتوں کا خلال کرنا",
-            "وضو کے بعد کلمہ شہادت پڑھنا"
-        ],
-        "makruh": [
-            "پانی ضائع کرنا",
-            "بلا ضرورت بات چیت کرنا",
-            "تین سے زیادہ بار دھونا",
-            "چہرہ دھوتے وقت آنکھیں بند کرنا"
-        ]
-    },
-    "ghusal": {
-        "farz": [
-            "کلی کرنا (منہ میں پانی پہنچانا)",
-            "ناک میں پانی ڈالنا (نرم ہڈی تک)",
-            "سارے بدن پر پانی بہانا (بال، ناخن اور جلد کا کوئی حصہ خشک نہ رہے)"
-        ],
-        "sunnat": [
-            "غسل شروع میں بسم اللہ پڑھنا",
-            "ہاتھ دھونا",
-            "پہلے وضو کرنا",
-            "پورے بدن پر تین بار پانی ڈالنا",
-            "پہلے دائیں طرف پھر بائیں طرف پانی ڈالنا"
-        ],
-        "mustahab": [
-            "غسل قبلہ رخ ہو کر کرنا",
-            "کسی جگہ بیٹھ کر غسل کرنا",
-            "غسل کے بعد نئے کپڑے پہننا"
-        ],
-        "makruh": [
-            "غسل میں بلا ضرورت بات چیت کرنا",
-            "پانی ضائع کرنا",
-            "کھلے آسمان تلے غسل کرنا"
-        ]
-    },
-    "conditions": {
-        "wudu_breaks": [
-            "پیشاب یا پاخانہ کا آنا",
-            "ہوا کا خارج ہونا",
-            "نیند آنا (اگر ٹیک لگا کر سویا ہو)",
-            "بے ہوشی طاری ہونا",
-            "قے آنا (بھر منہ)",
-            "نماز میں قہقہہ لگنا"
-        ],
-        "ghusal_required": [
-            "جنابت (احتلام یا جماع کے بعد)",
-            "حیض (ماہواری) ختم ہونے پر",
-            "نفاس (بچے کی پیدائش کے بعد خون) ختم ہونے پر"
-        ]
+@st.cache_data
+def render_hadith_details_html():
+    """Build the hadith list as one block of <details> rows, so the browser handles expand/collapse"""
+    return "".join([
+        f'<details class="hadith-details"><summary>حدیث نمبر {i} - <b>{hadith["reference"]}</b></summary>'
+        f'<div class="arabic-text">{hadith["arabic"]}</div>'
+        f'<div class="urdu-text">{hadith["urdu"]}</div></details>'
+        for i, hadith in enumerate(load_data().hadiths, 1)
+    ])
+
+@st.cache_data
+def render_taharat_html():
+    """Build the Taharat tabs' numbered lists and farz cards once; the numbering never changes"""
+    taharat_section = load_data().taharat_section
+    return {
+        "wudu_farz": "".join([
+            f'<div class="taharat-box taharat-wudu"><p class="urdu-text"><b>{i}.</b> {farz}</p></div>'
+            for i, farz in enumerate(taharat_section["wudu"]["farz"], 1)
+        ]),
+        "wudu_sunnat": _numbered_lines(taharat_section["wudu"]["sunnat"]),
+        "wudu_makruh": _numbered_lines(taharat_section["wudu"]["makruh"]),
+        "ghusal_farz": "".join([
+            f'<div class="taharat-box taharat-ghusal"><p class="urdu-text"><b>{i}.</b> {farz}</p></div>'
+            for i, farz in enumerate(taharat_section["ghusal"]["farz"], 1)
+        ]),
+        "ghusal_sunnat": _numbered_lines(taharat_section["ghusal"]["sunnat"]),
+        "wudu_breaks": _numbered_lines(taharat_section["conditions"]["wudu_breaks"]),
+        "ghusal_required": _numbered_lines(taharat_section["conditions"]["ghusal_required"]),
     }
-}
+
+@st.fragment
+def prayer_times_block():
+    """City picker and prayer times; runs as a fragment so changing the city only reruns this block"""
+    selected_city = st.selectbox("شہر منتخب کریں", list(_PRAYER_TIMES), key="selected_city")
+    prayer_times = get_prayer_times(selected_city)
+    
+    # Display prayer times as a single flex row
+    prayers_html = "".join([
+        f'<div class="prayer-time"><h4>{prayer}</h4><h3>{time}</h3></div>' for prayer, time in prayer_times.items()
+    ])
+    st.html(f'<div class="flex-row">{prayers_html}</div>')
+    
+    # Zawal time
+    dhuhr_time = prayer_times.get("ظہر", "12:30 PM")
+    zawal_time = get_zawal_time(dhuhr_time)
+    st.success(f"**⏰ زوال کا وقت:** **{zawal_time}** (اس وقت نماز مکروہ ہے)")
+    
+    st.info("⚠️ **نوٹ:** یہ اوقات صرف ایک تخمینہ ہیں؛ درست وقت کے لیے مقامی مسجد کے کیلنڈر پر انحصار کریں۔")
+
+PILLAR_LABELS = {"salah": "🕌 نماز", "fasting": "🌙 روزہ", "zakat": "💰 زکواۃ", "hajj": "🕋 حج", "jihad": "⚔️ جہاد"}
+
+@st.fragment
+def pillars_section(islamic_pillars):
+    """Pillars picker; only the chosen pillar is rendered, and switching reruns just this fragment"""
+    choice = st.radio(
+        "رکن منتخب کریں", list(PILLAR_LABELS), format_func=PILLAR_LABELS.get,
+        horizontal=True, key="pillar_tab", label_visibility="collapsed"
+    )
+    
+    if choice == "salah":
+        st.subheader(islamic_pillars["salah"]["title"])
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🕐 نماز کے اوقات")
+            st.info(_lines(islamic_pillars["salah"]["times"], "• **{}**"))
+        
+        with col2:
+            st.markdown("### 📝 بچوں کے لیے مشقیں")
+            st.warning(_lines(islamic_pillars["salah"]["kids_practice"], "• **{}**"))
+            
+            st.markdown("### 🎯 نماز کی اہمیت")
+            st.error(islamic_pillars["salah"]["importance"])
+    
+    elif choice == "fasting":
+        st.subheader(islamic_pillars["fasting"]["title"])
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🌅 روزہ کی اقسام")
+            st.info(_lines(islamic_pillars["fasting"]["types"], "• **{}**"))
+            
+            st.markdown("### 👶 بچوں کے لیے تجاویز")
+            st.error(_lines(islamic_pillars["fasting"]["kids_tips"], "• **{}**"))
+        
+        with col2:
+            st.markdown("### 💫 روزہ کے فوائد")
+            st.success(_lines(islamic_pillars["fasting"]["benefits"], "• **{}**"))
+
+    elif choice == "zakat":
+        st.subheader(islamic_pillars["zakat"]["title"])
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📊 زکواۃ کی شرائط")
+            st.info(_lines(islamic_pillars["zakat"]["conditions"], "• **{}**"))
+        
+        with col2:
+            st.markdown("### 🤲 زکواۃ کے مصارف")
+            st.warning(_lines(islamic_pillars["zakat"]["recipients"], "• **{}**"))
+    
+    elif choice == "hajj":
+        st.subheader(islamic_pillars["hajj"]["title"])
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🚶 حج کے مراحل")
+            st.warning(_lines(islamic_pillars["hajj"]["steps"], "• **{}**"))
+        
+        with col2:
+            st.markdown("### 💫 حج کے فوائد")
+            st.success(_lines(islamic_pillars["hajj"]["benefits"], "• **{}**"))
+    
+    elif choice == "jihad":
+        st.subheader(islamic_pillars["jihad"]["title"])
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### ⚔️ جہاد کی اقسام")
+            st.html("".join([
+                f'<div class="jihad-box"><p class="urdu-text">{type_jihad}</p></div>'
+                for type_jihad in islamic_pillars["jihad"]["types"]
+            ]))
+            
+            st.markdown("### 📋 شرائط")
+            st.info(_lines(islamic_pillars["jihad"]["conditions"], "• **{}**"))
+        
+        with col2:
+            st.markdown("### 💫 فوائد")
+            st.success(_lines(islamic_pillars["jihad"]["benefits"], "• **{}**"))
+            
+            st.markdown("### ❌ غلط فہمیاں")
+            st.error(_lines(islamic_pillars["jihad"]["misconceptions"], "• **{}**"))
+
+# --- Static page text ---
+_SIDEBAR_MENU_MD = """
+- 🌐 تعارف
+- 📅 تاریخوں کا نظام
+- 🕋 نماز کے اوقات  
+- 💎 توحید کی تعلیمات
+- 🌟 دین کے ارکان
+- 💧 وضو و غسل
+- 📖 احادیث مبارکہ و آیات
+- 👶 بچوں کا کونہ
+- 🎬 میڈیا گیلری
+- 👩‍💻 ڈویلپر کے بارے میں
+"""
+
+_DEV_INFO_MD = """
+**نام:** فریدہ بانو  
+**مقصد:** اسلامی تعلیمات کو عام کرنا  
+**ورژن:** 1.0
+**📧:** farida.bano@example.com
+"""
+
+_SIDEBAR_NOTE_MD = """
+**نوٹ:** یہ ایپلیکیشن اسلامی معلومات فراہم کرنے کے لیے بنائی گئی ہے۔ 
+فقہی مسائل کی مزید تفصیلات کے لیے اپنے مقامی **عالم دین** یا **مفتی** سے رجوع کریں۔
+"""
+
+_INTRO_HTML = '<div class="urdu-text">یہ پلیٹ فارم مسلمانوں کے لیے <b>قرآن و سنت</b> کی روشنی میں <b>صحیح اسلامی معلومات</b> کی فراہمی کے لیے بنایا گیا ہے۔ ہمارا مقصد <b>توحید، عبادات، اخلاقیات</b> اور دیگر دینی احکام کو <b>آسان اور منظم</b> انداز میں پیش کرنا ہے تاکہ ہر عمر کے افراد، خاص طور پر <b>نوجوان اور بچے</b>، اپنے دین کی بنیادی باتوں کو اچھی طرح سمجھ سکیں۔</div>'
+
+_HEADER_HTML = """
+<div class="main-header">
+    🕌 اسلامی معلومات کا مرکز
+    <br>
+    <small style="font-size: 1rem; color: #666;">تیار کردہ: فریدہ بانو</small>
+</div>
+"""
+
+_AVATAR_HTML = """
+<div style="text-align: center;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                width: 150px; height: 150px; border-radius: 50%; 
+                margin: 0 auto; display: flex; align-items: center; 
+                justify-content: center; color: white; font-size: 3rem;">
+        👩‍💻
+    </div>
+    <h3>فریدہ بانو</h3>
+    <p>ڈویلپر اور ڈیزائنر</p>
+</div>
+"""
+
+_ABOUT_HTML = """
+<div class="urdu-text">
+<h4>میرے بارے میں</h4>
+<p>میں فریدہ بانو ہوں اور میں نے یہ اسلامی ایپلیکیشن مسلمانوں کو ان کے دین کی بنیادی باتوں سے روشناس کرانے کے لیے بنائی ہے۔ میرا مقصد قرآن و سنت کی روشنی میں صحیح اسلامی معلومات کو آسان اور منظم انداز میں پیش کرنا ہے۔</p>
+
+<h4>مقاصد</h4>
+<ul>
+    <li>✅ اسلامی تعلیمات کو ڈیجیٹل پلیٹ فارم پر لانا</li>
+    <li>✅ نوجوانوں اور بچوں کے لیے اسلامی مواد کو پرکشش بنانا</li>
+    <li>✅ روزمرہ کی عبادات کو سمجھنے میں مدد فراہم کرنا</li>
+    <li>✅ امت مسلمہ کے لیے مفید ٹولز تیار کرنا</li>
+</ul>
+
+<h4>رابطہ</h4>
+<p> 📧 : faridabano159@gmail.com<br>
+🌐: www.islamicapp.com</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div class="developer-card">
+    <h4>🕌 اسلامی معلومات کا مرکز</h4>
+    <p>تیار کردہ: <strong>فریدہ بانو</strong></p>
+    <p>📧 رابطہ: faridabano159@gmail.com</p>
+    <p style="font-size: 0.8rem;">© 2024 تمام حقوق محفوظ ہیں</p>
+</div>
+"""
 
 # --- Main Streamlit App ---
 
@@ -446,235 +670,83 @@ def main():
         initial_sidebar_state="expanded"
     )
 
-    # Load Islamic images
-    islamic_images = load_islamic_images()
+    # Load Islamic content
+    content = load_data()
+    kids_section, tauheed_section, islamic_pillars = content.kids_section, content.tauheed_section, content.islamic_pillars
 
     # Custom CSS for better styling and font import
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Naskh+Arabic:wght@400;700&display=swap');
-        @import url('https://fonts.googleapis.com/css2?family=Jameel+Noori+Nastaleeq:wght@400;700&display=swap');
-        
-        .main-header {
-            font-size: 2.5rem;
-            color: #2E86AB;
-            text-align: center;
-            margin-bottom: 2rem;
-            font-weight: bold;
-            font-family: 'Jameel Noori Nastaleeq', 'Arial', sans-serif;
-        }
-        .section-header {
-            font-size: 1.8rem;
-            color: #A23B72;
-            margin: 1rem 0;
-            font-weight: bold;
-            font-family: 'Jameel Noori Nastaleeq', 'Arial', sans-serif;
-        }
-        .arabic-text {
-            font-size: 1.6rem;
-            text-align: right;
-            direction: rtl;
-            font-family: 'Noto Naskh Arabic', 'Traditional Arabic', serif;
-            line-height: 2;
-        }
-        .urdu-text {
-            font-size: 1.3rem;
-            text-align: right;
-            direction: rtl;
-            font-family: 'Jameel Noori Nastaleeq', 'Arial', serif;
-            line-height: 2;
-        }
-        .highlight-box {
-            background-color: #F8F9FA;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-right: 5px solid #2E86AB;
-            margin: 1rem 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .prayer-time {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            text-align: center;
-            margin: 0.5rem;
-        }
-        .date-box {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            text-align: center;
-            margin: 0.5rem;
-        }
-        .taharat-box {
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 0.5rem;
-        }
-        .tauheed-box {
-            background: linear-gradient(135deg, #ff6b6b 0%, #ffa8a8 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 0.5rem;
-            text-align: center;
-        }
-        .kids-section {
-            background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-        }
-        .jihad-box {
-            background: linear-gradient(135deg, #ff7eb3 0%, #ff758c 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 0.5rem;
-        }
-        .image-container {
-            text-align: center;
-            margin: 1rem 0;
-            padding: 1rem;
-            background: #f8f9fa;
-            border-radius: 10px;
-        }
-        .video-container {
-            text-align: center;
-            margin: 1rem 0;
-            padding: 1rem;
-            background: #f8f9fa;
-            border-radius: 10px;
-        }
-        .developer-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 2rem;
-            border-radius: 15px;
-            text-align: center;
-            margin: 1rem 0;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_css(), unsafe_allow_html=True)
 
     # Main header with developer name
-    st.markdown("""
-    <div class="main-header">
-        🕌 اسلامی معلومات کا مرکز
-        <br>
-        <small style="font-size: 1rem; color: #666;">تیار کردہ: فریدہ بانو</small>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_HEADER_HTML)
     
     # --- Sidebar ---
     with st.sidebar:
-        st.title("⚙️ ترتیبات")
-        selected_city = st.selectbox("شہر منتخب کریں", ["Karachi", "Lahore", "Islamabad", "Peshawar", "Quetta"])
-        
-        st.markdown("---")
         st.subheader("📚 فہرست")
-        st.markdown("""
-        - 🌐 تعارف
-        - 📅 تاریخوں کا نظام
-        - 🕋 نماز کے اوقات  
-        - 💎 توحید کی تعلیمات
-        - 🌟 دین کے ارکان
-        - 💧 وضو و غسل
-        - 📖 احادیث مبارکہ و آیات
-        - 👶 بچوں کا کونہ
-        - 🎬 میڈیا گیلری
-        - 👩‍💻 ڈویلپر کے بارے میں
-        """)
+        st.markdown(_SIDEBAR_MENU_MD)
         
         st.markdown("---")
         
         # Developer Info in Sidebar
         st.markdown("### 👩‍💻 ڈویلپر کی معلومات")
-        st.markdown("""
-        **نام:** فریدہ بانو  
-        **مقصد:** اسلامی تعلیمات کو عام کرنا  
-        **ورژن:** 1.0
-        **📧:** farida.bano@example.com
-        """)
+        st.markdown(_DEV_INFO_MD)
         
         st.markdown("---")
-        st.info("""
-        **نوٹ:** یہ ایپلیکیشن اسلامی معلومات فراہم کرنے کے لیے بنائی گئی ہے۔ 
-        فقہی مسائل کی مزید تفصیلات کے لیے اپنے مقامی **عالم دین** یا **مفتی** سے رجوع کریں۔
-        """)
+        st.info(_SIDEBAR_NOTE_MD)
     
     # --- Introduction Section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">🌐 ہمارا تعارف</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="urdu-text">یہ پلیٹ فارم مسلمانوں کے لیے **قرآن و سنت** کی روشنی میں **صحیح اسلامی معلومات** کی فراہمی کے لیے بنایا گیا ہے۔ ہمارا مقصد **توحید، عبادات، اخلاقیات** اور دیگر دینی احکام کو **آسان اور منظم** انداز میں پیش کرنا ہے تاکہ ہر عمر کے افراد، خاص طور پر **نوجوان اور بچے**، اپنے دین کی بنیادی باتوں کو اچھی طرح سمجھ سکیں۔</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">🌐 ہمارا تعارف</div>')
+    st.html(_INTRO_HTML)
 
     # --- Current date section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">📅 آج کی تاریخ</div>', unsafe_allow_html=True)
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        gregorian_date = datetime.date.today().strftime("%d %B, %Y")
-        st.markdown(f'<div class="date-box"><h4>عیسوی تاریخ</h4><h3>{gregorian_date}</h3></div>', unsafe_allow_html=True)
-    
-    with col2:
-        hijri_date = get_accurate_hijri_date()
-        st.markdown(f'<div class="date-box"><h4>ہجری تاریخ</h4><h3>{hijri_date}</h3></div>', unsafe_allow_html=True)
-    
-    with col3:
-        current_islamic_month = get_current_islamic_month()
-        st.markdown(f'<div class="date-box"><h4>اسلامی مہینہ</h4><h3>{current_islamic_month}</h3></div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">📅 آج کی تاریخ</div>')
+    
+    today = datetime.date.today()
+    gregorian_date = today.strftime("%d %B, %Y")
+    hijri_date = get_accurate_hijri_date(today.isoformat())
+    current_islamic_month = get_current_islamic_month(today.isoformat())
+    
+    # All three date boxes go out as a single flex row
+    st.html(
+        '<div class="flex-row">'
+        f'<div class="date-box"><h4>عیسوی تاریخ</h4><h3>{gregorian_date}</h3></div>'
+        f'<div class="date-box"><h4>ہجری تاریخ</h4><h3>{hijri_date}</h3></div>'
+        f'<div class="date-box"><h4>اسلامی مہینہ</h4><h3>{current_islamic_month}</h3></div>'
+        '</div>'
+    )
     
     # --- Prayer times section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">🕋 نماز کے اوقات</div>', unsafe_allow_html=True)
-    
-    prayer_times = get_prayer_times(selected_city)
+    st.html('<div class="section-header">🕋 نماز کے اوقات</div>')
     
-    # Display prayer times in columns
-    cols = st.columns(6)
-    prayers = list(prayer_times.items())
-    
-    for i, (prayer, time) in enumerate(prayers):
-        with cols[i]:
-            st.markdown(f'<div class="prayer-time"><h4>{prayer}</h4><h3>{time}</h3></div>', unsafe_allow_html=True)
-    
-    # Zawal time
-    dhuhr_time = prayer_times.get("ظہر", "12:30 PM")
-    zawal_time = get_zawal_time(dhuhr_time)
-    st.success(f"**⏰ زوال کا وقت:** **{zawal_time}** (اس وقت نماز مکروہ ہے)")
-    
-    st.info("⚠️ **نوٹ:** یہ اوقات صرف ایک تخمینہ ہیں؛ درست وقت کے لیے مقامی مسجد کے کیلنڈر پر انحصار کریں۔")
+    prayer_times_block()
 
     
     # --- Tauheed (توحید) Section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">💎 توحید - اسلام کی بنیاد</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">💎 توحید - اسلام کی بنیاد</div>')
     
+    tauheed_html = render_tauheed_html()
     tauheed_tab1, tauheed_tab2, tauheed_tab3, tauheed_tab4 = st.tabs(["تعارف", "اقسام", "فوائد", "قرآنی آیات"])
     
     with tauheed_tab1:
-        st.subheader(TAUHEED_SECTION["definition"]["title"])
-        st.markdown(f'<div class="urdu-text">{TAUHEED_SECTION["definition"]["description"]}</div>', unsafe_allow_html=True)
+        st.subheader(tauheed_section["definition"]["title"])
+        st.html(f'<div class="urdu-text">{tauheed_section["definition"]["description"]}</div>')
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("### 🎯 توحید کی اہمیت")
-            st.info(TAUHEED_SECTION["definition"]["importance"])
+            st.info(tauheed_section["definition"]["importance"])
             
             st.markdown("### 👶 بچوں کے لیے سیکھنے کے طریقے")
-            for learning in TAUHEED_SECTION["kids_learning"]:
-                st.success(f"• {learning}")
+            st.success(tauheed_html["kids_learning"])
         
         with col2:
             st.markdown("### 💫 توحید کے فوائد")
-            for benefit in TAUHEED_SECTION["benefits"]:
-                st.warning(f"• {benefit}")
+            st.warning(tauheed_html["benefits"])
             
             st.markdown("### 🕌 کلمہ طیبہ")
             st.error("**لَا إِلَٰهَ إِلَّا ٱللَّٰهُ مُحَمَّدٌ رَسُولُ ٱللَّٰهِ**")
@@ -686,22 +758,19 @@ def main():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown(f'### {TAUHEED_SECTION["types"]["rububiyyah"]["title"]}')
-            st.info(TAUHEED_SECTION["types"]["rububiyyah"]["description"])
-            for point in TAUHEED_SECTION["types"]["rububiyyah"]["points"]:
-                st.markdown(f'<div class="tauheed-box"><p class="urdu-text" style="font-size:1.1rem; color:white;">{point}</p></div>', unsafe_allow_html=True)
+            st.markdown(f'### {tauheed_section["types"]["rububiyyah"]["title"]}')
+            st.info(tauheed_section["types"]["rububiyyah"]["description"])
+            st.html(tauheed_html["points"]["rububiyyah"])
         
         with col2:
-            st.markdown(f'### {TAUHEED_SECTION["types"]["uluhiyyah"]["title"]}')
-            st.success(TAUHEED_SECTION["types"]["uluhiyyah"]["description"])
-            for point in TAUHEED_SECTION["types"]["uluhiyyah"]["points"]:
-                st.markdown(f'<div class="tauheed-box"><p class="urdu-text" style="font-size:1.1rem; color:white;">{point}</p></div>', unsafe_allow_html=True)
+            st.markdown(f'### {tauheed_section["types"]["uluhiyyah"]["title"]}')
+            st.success(tauheed_section["types"]["uluhiyyah"]["description"])
+            st.html(tauheed_html["points"]["uluhiyyah"])
         
         with col3:
-            st.markdown(f'### {TAUHEED_SECTION["types"]["asma_was_sifat"]["title"]}')
-            st.warning(TAUHEED_SECTION["types"]["asma_was_sifat"]["description"])
-            for point in TAUHEED_SECTION["types"]["asma_was_sifat"]["points"]:
-                st.markdown(f'<div class="tauheed-box"><p class="urdu-text" style="font-size:1.1rem; color:white;">{point}</p></div>', unsafe_allow_html=True)
+            st.markdown(f'### {tauheed_section["types"]["asma_was_sifat"]["title"]}')
+            st.warning(tauheed_section["types"]["asma_was_sifat"]["description"])
+            st.html(tauheed_html["points"]["asma_was_sifat"])
     
     with tauheed_tab3:
         st.subheader("توحید کے فوائد اور برکات")
@@ -710,134 +779,29 @@ def main():
         
         with col1:
             st.markdown("### روحانی فوائد")
-            benefits_spiritual = [
-                "اللہ کی محبت حاصل ہوتی ہے",
-                "دل میں اطمینان پیدا ہوتی ہے",
-                "گناہوں سے معافی ملتی ہے",
-                "جنت میں داخلہ ملتا ہے"
-            ]
-            for benefit in benefits_spiritual:
-                st.success(f"🌟 {benefit}")
+            st.success(tauheed_html["benefits_spiritual"])
         
         with col2:
             st.markdown("### دنیاوی فوائد")
-            benefits_worldly = [
-                "خوف و غم سے نجات ملتی ہے",
-                "عملوں میں برکت ہوتی ہے",
-                "دل کی پاکیزگی ہوتی ہے",
-                "شیطان کے شر سے حفاظت ہوتی ہے"
-            ]
-            for benefit in benefits_worldly:
-                st.info(f"💫 {benefit}")
+            st.info(tauheed_html["benefits_worldly"])
     
     with tauheed_tab4:
         st.subheader("توحید کے بارے میں قرآنی آیات")
         
-        for verse in TAUHEED_SECTION["quran_verses"]:
-            st.markdown(f"""
-            <div class="highlight-box">
-                <div class="arabic-text">{verse["arabic"]}</div>
-                <div class="urdu-text">{verse["urdu"]}</div>
-                <p style="text-align: left; color: #666;">📖 سورۃ **{verse["surah"]}** - آیت **{verse["verse"]}**</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.html(tauheed_html["verses"])
 
     
     # --- Islamic Pillars Section for Kids ---
     st.markdown("---")
-    st.markdown('<div class="section-header">🌟 دین کے ارکان - بچوں کے لیے</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">🌟 دین کے ارکان - بچوں کے لیے</div>')
     
-    pillars_tab1, pillars_tab2, pillars_tab3, pillars_tab4, pillars_tab5 = st.tabs(["🕌 نماز", "🌙 روزہ", "💰 زکواۃ", "🕋 حج", "⚔️ جہاد"])
-    
-    with pillars_tab1:
-        st.subheader(ISLAMIC_PILLARS["salah"]["title"])
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🕐 نماز کے اوقات")
-            for time in ISLAMIC_PILLARS["salah"]["times"]:
-                st.info(f"• **{time}**")
-        
-        with col2:
-            st.markdown("### 📝 بچوں کے لیے مشقیں")
-            for practice in ISLAMIC_PILLARS["salah"]["kids_practice"]:
-                st.warning(f"• **{practice}**")
-            
-            st.markdown("### 🎯 نماز کی اہمیت")
-            st.error(ISLAMIC_PILLARS["salah"]["importance"])
-    
-    with pillars_tab2:
-        st.subheader(ISLAMIC_PILLARS["fasting"]["title"])
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🌅 روزہ کی اقسام")
-            for type_fast in ISLAMIC_PILLARS["fasting"]["types"]:
-                st.info(f"• **{type_fast}**")
-            
-            st.markdown("### 👶 بچوں کے لیے تجاویز")
-            for tip in ISLAMIC_PILLARS["fasting"]["kids_tips"]:
-                st.error(f"• **{tip}**")
-        
-        with col2:
-            st.markdown("### 💫 روزہ کے فوائد")
-            for benefit in ISLAMIC_PILLARS["fasting"]["benefits"]:
-                st.success(f"• **{benefit}**")
-
-    with pillars_tab3:
-        st.subheader(ISLAMIC_PILLARS["zakat"]["title"])
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 📊 زکواۃ کی شرائط")
-            for condition in ISLAMIC_PILLARS["zakat"]["conditions"]:
-                st.info(f"• **{condition}**")
-        
-        with col2:
-            st.markdown("### 🤲 زکواۃ کے مصارف")
-            for recipient in ISLAMIC_PILLARS["zakat"]["recipients"]:
-                st.warning(f"• **{recipient}**")
-    
-    with pillars_tab4:
-        st.subheader(ISLAMIC_PILLARS["hajj"]["title"])
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🚶 حج کے مراحل")
-            for step in ISLAMIC_PILLARS["hajj"]["steps"]:
-                st.warning(f"• **{step}**")
-        
-        with col2:
-            st.markdown("### 💫 حج کے فوائد")
-            for benefit in ISLAMIC_PILLARS["hajj"]["benefits"]:
-                st.success(f"• **{benefit}**")
-    
-    with pillars_tab5:
-        st.subheader(ISLAMIC_PILLARS["jihad"]["title"])
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### ⚔️ جہاد کی اقسام")
-            for type_jihad in ISLAMIC_PILLARS["jihad"]["types"]:
-                st.markdown(f'<div class="jihad-box"><p class="urdu-text" style="font-size:1.1rem; color:white;">{type_jihad}</p></div>', unsafe_allow_html=True)
-            
-            st.markdown("### 📋 شرائط")
-            for condition in ISLAMIC_PILLARS["jihad"]["conditions"]:
-                st.info(f"• **{condition}**")
-        
-        with col2:
-            st.markdown("### 💫 فوائد")
-            for benefit in ISLAMIC_PILLARS["jihad"]["benefits"]:
-                st.success(f"• **{benefit}**")
-            
-            st.markdown("### ❌ غلط فہمیاں")
-            for misconception in ISLAMIC_PILLARS["jihad"]["misconceptions"]:
-                st.error(f"• **{misconception}**")
+    pillars_section(islamic_pillars)
     
     # --- Taharat (Wudu & Ghusal) Section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">💧 وضو و غسل</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">💧 وضو و غسل</div>')
     
+    taharat_html = render_taharat_html()
     taharat_tab1, taharat_tab2, taharat_tab3 = st.tabs(["وضو کے احکام", "غسل کے احکام", "اہم شرائط"])
     
     with taharat_tab1:
@@ -847,18 +811,15 @@ def main():
         
         with col1:
             st.markdown("### فرض (4)")
-            for i, farz in enumerate(TAHARAT_SECTION["wudu"]["farz"], 1):
-                st.markdown(f'<div class="taharat-box" style="background: #2E86AB;"><p class="urdu-text" style="font-size:1rem; color:white;">**{i}.** {farz}</p></div>', unsafe_allow_html=True)
+            st.html(taharat_html["wudu_farz"])
         
         with col2:
             st.markdown("### سنتیں")
-            for i, sunnat in enumerate(TAHARAT_SECTION["wudu"]["sunnat"], 1):
-                st.info(f"**{i}.** {sunnat}")
+            st.info(taharat_html["wudu_sunnat"])
             
         with col3:
             st.markdown("### مکروہات")
-            for i, makruh in enumerate(TAHARAT_SECTION["wudu"]["makruh"], 1):
-                st.error(f"**{i}.** {makruh}")
+            st.error(taharat_html["wudu_makruh"])
         
         st.caption("✅ **یاد رکھیں:** وضو کے چار فرائض ادا نہ ہونے سے وضو نہیں ہوتا۔")
     
@@ -869,13 +830,11 @@ def main():
         
         with col1:
             st.markdown("### فرض (3)")
-            for i, farz in enumerate(TAHARAT_SECTION["ghusal"]["farz"], 1):
-                st.markdown(f'<div class="taharat-box" style="background: #A23B72;"><p class="urdu-text" style="font-size:1rem; color:white;">**{i}.** {farz}</p></div>', unsafe_allow_html=True)
+            st.html(taharat_html["ghusal_farz"])
         
         with col2:
             st.markdown("### سنتیں")
-            for i, sunnat in enumerate(TAHARAT_SECTION["ghusal"]["sunnat"], 1):
-                st.info(f"**{i}.** {sunnat}")
+            st.info(taharat_html["ghusal_sunnat"])
             
         st.caption("⚠️ **انتباہ:** غسل کے تین فرائض میں سے کسی ایک کا بھی رہ جانا غسل کو نامکمل کر دیتا ہے۔")
     
@@ -886,228 +845,129 @@ def main():
         
         with col1:
             st.markdown("### وضو ٹوٹنے کی وجوہات")
-            for i, condition in enumerate(TAHARAT_SECTION["conditions"]["wudu_breaks"], 1):
-                st.error(f"**{i}.** {condition}")
+            st.error(taharat_html["wudu_breaks"])
         
         with col2:
             st.markdown("### غسل فرض ہونے کے اوقات")
-            for i, condition in enumerate(TAHARAT_SECTION["conditions"]["ghusal_required"], 1):
-                st.warning(f"**{i}.** {condition}")
+            st.warning(taharat_html["ghusal_required"])
     
     st.info("💡 **نوٹ:** وضو اور غسل کے احکام میں فقہی مکاتب فکر کے مطابق معمولی فرق ہو سکتا ہے۔")
 
     # --- Hadith & Quran Verses Section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">📖 احادیث مبارکہ اور قرآنی آیات</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">📖 احادیث مبارکہ اور قرآنی آیات</div>')
     
     # Combined Tabs
     hadith_tab1, hadith_tab2, hadith_tab3 = st.tabs(["📜 احادیث دیکھیں", "📘 آیات دیکھیں", "🔍 تلاش کریں"])
     
     with hadith_tab1:
         st.subheader("مشہور احادیث")
-        for i, hadith in enumerate(HADITHS, 1):
-            with st.expander(f"حدیث نمبر {i} - **{hadith['reference']}**", expanded=False):
-                st.markdown(f'<div class="arabic-text">{hadith["arabic"]}</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="urdu-text">{hadith["urdu"]}</div>', unsafe_allow_html=True)
+        st.html(render_hadith_details_html())
     
     with hadith_tab2:
         st.subheader("منتخب قرآنی آیات")
-        for verse in QURAN_VERSES:
-            st.markdown(f"""
-            <div class="highlight-box">
-                <div class="arabic-text">{verse["arabic"]}</div>
-                <div class="urdu-text">{verse["urdu"]}</div>
-                <p style="text-align: left; color: #666;">📖 سورۃ **{verse["surah"]}** - آیت **{verse["verse"]}**</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.html("".join([_VERSE_TMPL.format(**verse) for verse in load_data().quran_verses]))
             
     with hadith_tab3:
-        search_term = st.text_input("🔍 حدیث یا آیت تلاش کریں (عربی یا اردو میں)")
+        # The term is only committed on submit, so typing never triggers a search rerun
+        with st.form("search_form"):
+            search_term = st.text_input("🔍 حدیث یا آیت تلاش کریں (عربی یا اردو میں)")
+            st.form_submit_button("تلاش")
         if search_term:
-            # Search Hadiths
-            found_hadiths = [h for h in HADITHS if search_term.lower() in h["arabic"].lower() or search_term in h["urdu"]]
-            # Search Verses
-            found_verses = [v for v in QURAN_VERSES if search_term.lower() in v["arabic"].lower() or search_term in v["urdu"]]
+            found_hadiths, found_verses = do_search(search_term)
             
             if found_hadiths or found_verses:
                 st.markdown("### 📜 احادیث کے نتائج")
-                for hadith in found_hadiths:
-                    st.markdown(f"""
-                    <div class="highlight-box" style="border-right: 5px solid #A23B72;">
-                        <div class="arabic-text">{hadith["arabic"]}</div>
-                        <div class="urdu-text">{hadith["urdu"]}</div>
-                        <p style="text-align: left;">📚 حوالہ: {hadith['reference']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                if found_hadiths:
+                    st.html("".join([_HADITH_TMPL.format(**hadith) for hadith in found_hadiths]))
                 
                 st.markdown("### 📘 آیات کے نتائج")
-                for verse in found_verses:
-                    st.markdown(f"""
-                    <div class="highlight-box" style="border-right: 5px solid #2E86AB;">
-                        <div class="arabic-text">{verse["arabic"]}</div>
-                        <div class="urdu-text">{verse["urdu"]}</div>
-                        <p style="text-align: left; color: #666;">📖 سورۃ **{verse["surah"]}** - آیت **{verse["verse"]}**</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                if found_verses:
+                    st.html("".join([_VERSE_TMPL.format(**verse) for verse in found_verses]))
             else:
                 st.warning("آپ کی تلاش سے متعلق کوئی حدیث یا آیت نہیں ملی۔")
 
     # --- Kids section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">👶 بچوں کا کونہ</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">👶 بچوں کا کونہ</div>')
     
     kids_tab1, kids_tab2, kids_tab3 = st.tabs(["📚 اسلامی کہانیاں", "🤲 چھوٹی دعائیں", "🎨 سرگرمیاں"])
     
     with kids_tab1:
         st.subheader("چھوٹے بچوں کے لیے اسلامی کہانیاں")
-        for story in KIDS_SECTION["stories"]:
-            st.markdown(f"""
-            <div class="kids-section">
+        st.html("".join([
+            f'''<div class="kids-section">
                 <h4 style="color:#A23B72;">{story["title"]}</h4>
                 <p class="urdu-text" style="font-size:1.1rem; direction:rtl;">{story["content"]}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            </div>'''
+            for story in kids_section["stories"]
+        ]))
             
     with kids_tab2:
         st.subheader("روزمرہ کی چھوٹی دعائیں")
-        for i, dua in enumerate(KIDS_SECTION["duas"], 1):
-            st.markdown(f"""
-            <div class="highlight-box" style="border-right: 5px solid #A23B72;">
-                <h5 style="text-align: right; direction: rtl;">{i}. {dua["urdu"]}</h5>
-                <div class="arabic-text">{dua["arabic"]}</div>
-                <p style="text-align: left; color: #666;">📚 ماخذ: {dua['source']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.html("".join([_DUA_TMPL.format(i=i, **dua) for i, dua in enumerate(kids_section["duas"], 1)]))
             
     with kids_tab3:
         st.subheader("بچوں کے لیے دینی سرگرمیاں")
-        st.markdown("""
+        st.html("""
         <div class="kids-section" style="background-color:#E3F2FD;">
             <p class="urdu-text">
-                - **نماز کا چارٹ:** ایک چارٹ بنائیں اور روزانہ کی پانچ نمازوں کو نشان زد کریں۔ <br>
-                - **اللہ کے ناموں کا کھیل:** اللہ کے 99 ناموں میں سے ہر ہفتے ایک نام یاد کریں اور اس کا مطلب سمجھیں۔ <br>
-                - **صدقہ کا ڈبہ:** ایک ڈبہ بنائیں اور روزانہ اس میں چند سکے ڈالیں تاکہ صدقہ کی عادت ڈالی جا سکے۔ <br>
-                - **وضو کا عملی مظاہرہ:** وضو کے مراحل کو عملی طور پر کر کے دکھائیں۔ 
+                - <b>نماز کا چارٹ:</b> ایک چارٹ بنائیں اور روزانہ کی پانچ نمازوں کو نشان زد کریں۔ <br>
+                - <b>اللہ کے ناموں کا کھیل:</b> اللہ کے 99 ناموں میں سے ہر ہفتے ایک نام یاد کریں اور اس کا مطلب سمجھیں۔ <br>
+                - <b>صدقہ کا ڈبہ:</b> ایک ڈبہ بنائیں اور روزانہ اس میں چند سکے ڈالیں تاکہ صدقہ کی عادت ڈالی جا سکے۔ <br>
+                - <b>وضو کا عملی مظاہرہ:</b> وضو کے مراحل کو عملی طور پر کر کے دکھائیں۔ 
             </p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
         
         st.warning("📣 مزید معلومات جلد شامل کی جائیں گی! بچوں کے لیے کارٹونز اور ویڈیوز کے لنکس بھی یہاں شامل کیے جا سکتے ہیں۔")
 
     # --- Media Gallery Section (Updated to use local images) ---
     st.markdown("---")
-    st.markdown('<div class="section-header">🎬 میڈیا گیلری</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">🎬 میڈیا گیلری</div>')
+    
+    # Load Islamic images (the folder check stays outside the cached loader so the warning shows on every run)
+    if os.path.isdir(IMAGE_FOLDER):
+        islamic_images = load_islamic_images()
+    else:
+        st.warning(f"📁 '{IMAGE_FOLDER}' فولڈر نہیں ملا۔ براہ کرم چیک کریں کہ فولڈر موجود ہے۔")
+        islamic_images = {}
     
     media_tab1, media_tab2 = st.tabs(["🖼️ تصاویر", "🎥 ویڈیوز"])
     
     with media_tab1:
         st.subheader("اسلامی مقامات کی تصاویر")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown('<div class="image-container">', unsafe_allow_html=True)
-            st.markdown("### مسجد الحرام، مکہ")
-            if "masjid_haram" in islamic_images:
-                st.image(islamic_images["masjid_haram"], use_container_width=True, caption="مسجد الحرام، مکہ مکرمہ")
-            else:
-                st.info("📷 مسجد الحرام کی تصویر 'islamic/101.jpg' فائل میں شامل کریں")
-            st.markdown("**مکہ مکرمہ، سعودی عرب**")
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            st.markdown('<div class="image-container">', unsafe_allow_html=True)
-            st.markdown("### مسجد نبوی، مدینہ")
-            if "masjid_nabwi" in islamic_images:
-                st.image(islamic_images["masjid_nabwi"], use_container_width=True, caption="مسجد نبوی، مدینہ منورہ")
-            else:
-                st.info("📷 مسجد نبوی کی تصویر 'islamic/102.jpg' فائل میں شامل کریں")
-            st.markdown("**مدینہ منورہ، سعودی عرب**")
-            st.markdown("</div>", unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown('<div class="image-container">', unsafe_allow_html=True)
-            st.markdown("### مسجد اقصیٰ، فلسطین")
-            if "masjid_aqsa" in islamic_images:
-                st.image(islamic_images["masjid_aqsa"], use_container_width=True, caption="مسجد اقصیٰ، بیت المقدس")
-            else:
-                st.info("📷 مسجد اقصیٰ کی تصویر 'islamic/103.jpg' فائل میں شامل کریں")
-            st.markdown("**بیت المقدس، فلسطین**")
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            st.markdown('<div class="image-container">', unsafe_allow_html=True)
-            st.markdown("### فتح مکہ")
-            if "fateh_makkah" in islamic_images:
-                st.image(islamic_images["fateh_makkah"], use_container_width=True, caption="فتح مکہ کا منظر")
-            else:
-                st.info("📷 فتح مکہ کی تصویر 'islamic/104.jpg' فائل میں شامل کریں")
-            st.markdown("**8ھ میں رسول اللہ ﷺ کا مکہ فتح کرنا**")
-            st.markdown("</div>", unsafe_allow_html=True)
+        st.html(render_gallery_html(tuple(sorted(islamic_images)), islamic_images))
     
     with media_tab2:
         st.subheader("تعلیمی ویڈیوز")
         
-        st.markdown('<div class="video-container">', unsafe_allow_html=True)
-        st.markdown("### وضو کا صحیح طریقہ")
-        st.video("https://youtu.be/3ecRdD9HqZY?si=xD06iq_8kazGiiFG")  # Replace with actual Islamic educational video URL
-        st.markdown("**وضو کے فرائض، سنن اور طریقہ کار**")
-        st.markdown("</div>", unsafe_allow_html=True)
+        with st.container(key="video_wudu"):
+            st.markdown("### وضو کا صحیح طریقہ")
+            st.video("https://youtu.be/3ecRdD9HqZY?si=xD06iq_8kazGiiFG")  # Replace with actual Islamic educational video URL
+            st.markdown("**وضو کے فرائض، سنن اور طریقہ کار**")
         
-        st.markdown('<div class="video-container">', unsafe_allow_html=True)
-        st.markdown("### نماز کا مکمل طریقہ")
-        st.video("https://youtu.be/flzX2XGwrdA?si=whqRSkqoFGDIf8tF")  # Replace with actual Islamic educational video URL
-        st.markdown("**نماز کے تمام ارکان اور شرائط**")
-        st.markdown("</div>", unsafe_allow_html=True)
+        with st.container(key="video_salah"):
+            st.markdown("### نماز کا مکمل طریقہ")
+            st.video("https://youtu.be/flzX2XGwrdA?si=whqRSkqoFGDIf8tF")  # Replace with actual Islamic educational video URL
+            st.markdown("**نماز کے تمام ارکان اور شرائط**")
 
     # --- About Developer Section ---
     st.markdown("---")
-    st.markdown('<div class="section-header">👩‍💻 ڈویلپر کے بارے میں</div>', unsafe_allow_html=True)
+    st.html('<div class="section-header">👩‍💻 ڈویلپر کے بارے میں</div>')
     
     col1, col2 = st.columns([1, 2])
 
     with col1:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        width: 150px; height: 150px; border-radius: 50%; 
-                        margin: 0 auto; display: flex; align-items: center; 
-                        justify-content: center; color: white; font-size: 3rem;">
-                👩‍💻
-            </div>
-            <h3>فریدہ بانو</h3>
-            <p>ڈویلپر اور ڈیزائنر</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_AVATAR_HTML)
 
     with col2:
-        st.markdown("""
-        <div class="urdu-text">
-        <h4>میرے بارے میں</h4>
-        <p>میں فریدہ بانو ہوں اور میں نے یہ اسلامی ایپلیکیشن مسلمانوں کو ان کے دین کی بنیادی باتوں سے روشناس کرانے کے لیے بنائی ہے۔ میرا مقصد قرآن و سنت کی روشنی میں صحیح اسلامی معلومات کو آسان اور منظم انداز میں پیش کرنا ہے۔</p>
-        
-        <h4>مقاصد</h4>
-        <ul>
-            <li>✅ اسلامی تعلیمات کو ڈیجیٹل پلیٹ فارم پر لانا</li>
-            <li>✅ نوجوانوں اور بچوں کے لیے اسلامی مواد کو پرکشش بنانا</li>
-            <li>✅ روزمرہ کی عبادات کو سمجھنے میں مدد فراہم کرنا</li>
-            <li>✅ امت مسلمہ کے لیے مفید ٹولز تیار کرنا</li>
-        </ul>
-        
-        <h4>رابطہ</h4>
-        <p> 📧 : faridabano159@gmail.com<br>
-        🌐: www.islamicapp.com</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_ABOUT_HTML)
 
     # --- Footer with Developer Info ---
     st.markdown("---")
-    st.markdown("""
-    <div class="developer-card">
-        <h4>🕌 اسلامی معلومات کا مرکز</h4>
-        <p>تیار کردہ: <strong>فریدہ بانو</strong></p>
-        <p>📧 رابطہ: faridabano159@gmail.com</p>
-        <p style="font-size: 0.8rem;">© 2024 تمام حقوق محفوظ ہیں</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_FOOTER_HTML)
 
 # --- Run the App ---
 if __name__ == "__main__":